@@ -19,7 +19,6 @@ from collections import OrderedDict
 import functools
 import re
 from typing import Dict, Sequence, Tuple, Type, Union
-import pkg_resources
 
 import google.api_core.client_options as ClientOptions  # type: ignore
 from google.api_core import exceptions  # type: ignore
@@ -33,7 +32,7 @@ from google.cloud.accessapproval_v1.types import accessapproval
 from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
 from google.protobuf import timestamp_pb2 as timestamp  # type: ignore
 
-from .transports.base import AccessApprovalTransport
+from .transports.base import AccessApprovalTransport, _client_info
 from .transports.grpc_asyncio import AccessApprovalGrpcAsyncIOTransport
 from .client import AccessApprovalClient
 
@@ -654,14 +653,4 @@ class AccessApprovalAsyncClient:
         )
 
 
-try:
-    _client_info = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution(
-            "google-cloud-access-approval",
-        ).version,
-    )
-except pkg_resources.DistributionNotFound:
-    _client_info = gapic_v1.client_info.ClientInfo()
-
-
 __all__ = ("AccessApprovalAsyncClient",)
@@ -17,7 +17,6 @@
 
 import abc
 import typing
-import pkg_resources
 
 from google import auth
 from google.api_core import exceptions  # type: ignore
@@ -29,20 +28,34 @@ from google.cloud.accessapproval_v1.types import accessapproval
 from google.protobuf import empty_pb2 as empty  # type: ignore
 
 
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:  # pragma: NO COVER
+    # Python < 3.8. pkg_resources is slow to import, so only fall back to it
+    # where importlib.metadata is unavailable.
+    from pkg_resources import DistributionNotFound as PackageNotFoundError
+    from pkg_resources import get_distribution
+
+    def version(distribution_name):
+        return get_distribution(distribution_name).version
+
+
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution(
-            "google-cloud-access-approval",
-        ).version,
+        gapic_version=version("google-cloud-access-approval"),
     )
-except pkg_resources.DistributionNotFound:
+except PackageNotFoundError:
     _client_info = gapic_v1.client_info.ClientInfo()
 
 
 class AccessApprovalTransport(abc.ABC):
     """Abstract transport class for AccessApproval."""
 
-    AUTH_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+    __slots__ = ("_host", "_credentials", "_wrapped_methods", "__weakref__")
+
+    AUTH_SCOPES: typing.Tuple[str, ...] = (
+        "https://www.googleapis.com/auth/cloud-platform",
+    )
 
     def __init__(
         self,
@@ -52,6 +65,7 @@ class AccessApprovalTransport(abc.ABC):
         credentials_file: typing.Optional[str] = None,
         scopes: typing.Optional[typing.Sequence[str]] = AUTH_SCOPES,
         quota_project_id: typing.Optional[str] = None,
+        skip_credentials: bool = False,
         **kwargs,
     ) -> None:
         """Instantiate the transport.
@@ -69,6 +83,9 @@ class AccessApprovalTransport(abc.ABC):
             scope (Optional[Sequence[str]]): A list of scopes.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            skip_credentials (Optional[bool]): If True, do not load or look
+                up credentials, because the subclass was given a channel that
+                already carries them.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ":" not in host:
@@ -82,7 +99,10 @@ class AccessApprovalTransport(abc.ABC):
                 "'credentials_file' and 'credentials' are mutually exclusive"
             )
 
-        if credentials_file is not None:
+        if skip_credentials:
+            credentials = None
+
+        elif credentials_file is not None:
             credentials, _ = auth.load_credentials_from_file(
                 credentials_file, scopes=scopes, quota_project_id=quota_project_id
             )
@@ -95,9 +115,16 @@ class AccessApprovalTransport(abc.ABC):
         # Save the credentials.
         self._credentials = credentials
 
+        # Let subclasses set up anything that needs the credentials, such as
+        # their channel, before the methods are wrapped.
+        self._post_credentials_init()
+
         # Lifted into its own function so it can be stubbed out during tests.
         self._prep_wrapped_messages()
 
+    def _post_credentials_init(self):
+        """Hook run once the credentials are resolved. Does nothing here."""
+
     def _prep_wrapped_messages(self):
         # Precompute the wrapped methods.
         self._wrapped_methods = {
@@ -15,7 +15,12 @@
 # limitations under the License.
 #
 
-from typing import Callable, Dict, Optional, Sequence, Tuple
+import collections
+import functools
+import itertools
+import operator
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from google.api_core import grpc_helpers  # type: ignore
 from google import auth  # type: ignore
@@ -31,6 +36,355 @@ from google.protobuf import empty_pb2 as empty  # type: ignore
 from .base import AccessApprovalTransport
 
 
+# Request serializers and response deserializers, resolved once at import.
+_LIST_APPROVAL_REQUESTS_SER = accessapproval.ListApprovalRequestsMessage.serialize
+_GET_APPROVAL_REQUEST_SER = accessapproval.GetApprovalRequestMessage.serialize
+_APPROVE_APPROVAL_REQUEST_SER = accessapproval.ApproveApprovalRequestMessage.serialize
+_DISMISS_APPROVAL_REQUEST_SER = accessapproval.DismissApprovalRequestMessage.serialize
+_GET_ACCESS_APPROVAL_SETTINGS_SER = (
+    accessapproval.GetAccessApprovalSettingsMessage.serialize
+)
+_UPDATE_ACCESS_APPROVAL_SETTINGS_SER = (
+    accessapproval.UpdateAccessApprovalSettingsMessage.serialize
+)
+_DELETE_ACCESS_APPROVAL_SETTINGS_SER = (
+    accessapproval.DeleteAccessApprovalSettingsMessage.serialize
+)
+_LIST_APPROVAL_REQUESTS_DES = accessapproval.ListApprovalRequestsResponse.deserialize
+_APPROVAL_REQUEST_DES = accessapproval.ApprovalRequest.deserialize
+_ACCESS_APPROVAL_SETTINGS_DES = accessapproval.AccessApprovalSettings.deserialize
+_EMPTY_DES = empty.Empty.FromString
+
+# The RPCs exposed by the transport, as (name, method path, request
+# serializer, response deserializer, stub type, stub docstring). gRPC handles
+# serialization and deserialization, so we just need to pass in the
+# functions for each.
+# Method paths stay str: client interceptors see them as
+# ``ClientCallDetails.method``, which gRPC documents as a str, and gRPC only
+# encodes them once, when each stub is bound.
+_RPCS = (
+    (
+        "list_approval_requests",
+        "/google.cloud.accessapproval.v1.AccessApproval/ListApprovalRequests",
+        _LIST_APPROVAL_REQUESTS_SER,
+        _LIST_APPROVAL_REQUESTS_DES,
+        Callable[
+            [accessapproval.ListApprovalRequestsMessage],
+            accessapproval.ListApprovalRequestsResponse,
+        ],
+        r"""Return a callable for the list approval requests method over gRPC.
+
+        Lists approval requests associated with a project,
+        folder, or organization. Approval requests can be
+        filtered by state (pending, active, dismissed). The
+        order is reverse chronological.
+
+        Returns:
+            Callable[[~.ListApprovalRequestsMessage],
+                    ~.ListApprovalRequestsResponse]:
+                A function that, when called, will call the underlying RPC
+                on the server.
+        """,
+    ),
+    (
+        "get_approval_request",
+        "/google.cloud.accessapproval.v1.AccessApproval/GetApprovalRequest",
+        _GET_APPROVAL_REQUEST_SER,
+        _APPROVAL_REQUEST_DES,
+        Callable[
+            [accessapproval.GetApprovalRequestMessage], accessapproval.ApprovalRequest
+        ],
+        r"""Return a callable for the get approval request method over gRPC.
+
+        Gets an approval request. Returns NOT_FOUND if the request does
+        not exist.
+
+        Returns:
+            Callable[[~.GetApprovalRequestMessage],
+                    ~.ApprovalRequest]:
+                A function that, when called, will call the underlying RPC
+                on the server.
+        """,
+    ),
+    (
+        "approve_approval_request",
+        "/google.cloud.accessapproval.v1.AccessApproval/ApproveApprovalRequest",
+        _APPROVE_APPROVAL_REQUEST_SER,
+        _APPROVAL_REQUEST_DES,
+        Callable[
+            [accessapproval.ApproveApprovalRequestMessage],
+            accessapproval.ApprovalRequest,
+        ],
+        r"""Return a callable for the approve approval request method over gRPC.
+
+        Approves a request and returns the updated ApprovalRequest.
+
+        Returns NOT_FOUND if the request does not exist. Returns
+        FAILED_PRECONDITION if the request exists but is not in a
+        pending state.
+
+        Returns:
+            Callable[[~.ApproveApprovalRequestMessage],
+                    ~.ApprovalRequest]:
+                A function that, when called, will call the underlying RPC
+                on the server.
+        """,
+    ),
+    (
+        "dismiss_approval_request",
+        "/google.cloud.accessapproval.v1.AccessApproval/DismissApprovalRequest",
+        _DISMISS_APPROVAL_REQUEST_SER,
+        _APPROVAL_REQUEST_DES,
+        Callable[
+            [accessapproval.DismissApprovalRequestMessage],
+            accessapproval.ApprovalRequest,
+        ],
+        r"""Return a callable for the dismiss approval request method over gRPC.
+
+        Dismisses a request. Returns the updated ApprovalRequest.
+
+        NOTE: This does not deny access to the resource if another
+        request has been made and approved. It is equivalent in effect
+        to ignoring the request altogether.
+
+        Returns NOT_FOUND if the request does not exist.
+
+        Returns FAILED_PRECONDITION if the request exists but is not in
+        a pending state.
+
+        Returns:
+            Callable[[~.DismissApprovalRequestMessage],
+                    ~.ApprovalRequest]:
+                A function that, when called, will call the underlying RPC
+                on the server.
+        """,
+    ),
+    (
+        "get_access_approval_settings",
+        "/google.cloud.accessapproval.v1.AccessApproval/GetAccessApprovalSettings",
+        _GET_ACCESS_APPROVAL_SETTINGS_SER,
+        _ACCESS_APPROVAL_SETTINGS_DES,
+        Callable[
+            [accessapproval.GetAccessApprovalSettingsMessage],
+            accessapproval.AccessApprovalSettings,
+        ],
+        r"""Return a callable for the get access approval settings method over gRPC.
+
+        Gets the settings associated with a project, folder,
+        or organization.
+
+        Returns:
+            Callable[[~.GetAccessApprovalSettingsMessage],
+                    ~.AccessApprovalSettings]:
+                A function that, when called, will call the underlying RPC
+                on the server.
+        """,
+    ),
+    (
+        "update_access_approval_settings",
+        "/google.cloud.accessapproval.v1.AccessApproval/UpdateAccessApprovalSettings",
+        _UPDATE_ACCESS_APPROVAL_SETTINGS_SER,
+        _ACCESS_APPROVAL_SETTINGS_DES,
+        Callable[
+            [accessapproval.UpdateAccessApprovalSettingsMessage],
+            accessapproval.AccessApprovalSettings,
+        ],
+        r"""Return a callable for the update access approval
+        settings method over gRPC.
+
+        Updates the settings associated with a project, folder, or
+        organization. Settings to update are determined by the value of
+        field_mask.
+
+        Returns:
+            Callable[[~.UpdateAccessApprovalSettingsMessage],
+                    ~.AccessApprovalSettings]:
+                A function that, when called, will call the underlying RPC
+                on the server.
+        """,
+    ),
+    (
+        "delete_access_approval_settings",
+        "/google.cloud.accessapproval.v1.AccessApproval/DeleteAccessApprovalSettings",
+        _DELETE_ACCESS_APPROVAL_SETTINGS_SER,
+        _EMPTY_DES,
+        Callable[[accessapproval.DeleteAccessApprovalSettingsMessage], empty.Empty],
+        r"""Return a callable for the delete access approval
+        settings method over gRPC.
+
+        Deletes the settings associated with a project,
+        folder, or organization. This will have the effect of
+        disabling Access Approval for the project, folder, or
+        organization, but only if all ancestors also have Access
+        Approval disabled. If Access Approval is enabled at a
+        higher level of the hierarchy, then Access Approval will
+        still be enabled at this level as the settings are
+        inherited.
+
+        Returns:
+            Callable[[~.DeleteAccessApprovalSettingsMessage],
+                    ~.Empty]:
+                A function that, when called, will call the underlying RPC
+                on the server.
+        """,
+    ),
+)
+
+
+# Keepalive settings applied to every channel unless the caller overrides
+# them, so that idle connections stay open between bursts of calls instead
+# of needing a new TLS handshake.
+_DEFAULT_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+)
+
+
+# Channels shared by every transport in the process, keyed by the arguments
+# the transports were created with and kept in least-recently-used order.
+_CHANNEL_CACHE_SIZE = 16
+_CHANNEL_CACHE = collections.OrderedDict()  # type: collections.OrderedDict
+_CHANNEL_CACHE_LOCK = threading.Lock()
+# How many handles on each cached channel are still open.
+_CHANNEL_REFS = {}  # type: Dict[grpc.Channel, int]
+
+
+def _release_channel(channel: grpc.Channel) -> None:
+    """Drop one reference to ``channel``, closing it once it is unused."""
+    with _CHANNEL_CACHE_LOCK:
+        refs = _CHANNEL_REFS.pop(channel, 1) - 1
+        if refs:
+            _CHANNEL_REFS[channel] = refs
+            return
+        for key, cached in list(_CHANNEL_CACHE.items()):
+            if cached is channel:
+                del _CHANNEL_CACHE[key]
+                break
+    channel.close()
+
+
+def _close_pool(ready: Sequence[grpc.Future], pool: Sequence[grpc.Channel]) -> None:
+    """Cancel the ready futures ``ready`` and close the channels in ``pool``."""
+    # Cancelling unsubscribes the futures, so that gRPC stops watching the
+    # channels' connectivity.
+    for future in ready:
+        future.cancel()
+    for channel in pool:
+        channel.close()
+
+
+class _SharedChannel(grpc.Channel):
+    """A handle on a channel shared through the channel cache.
+
+    Closing the handle releases it. The underlying channel is closed, and
+    dropped from the cache, once every handle on it has been closed.
+    """
+
+    def __init__(self, channel: grpc.Channel) -> None:
+        self._channel = channel
+        self._callbacks = []  # type: List[Callable]
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback, try_to_connect=False):
+        with self._lock:
+            self._callbacks.append(callback)
+        self._channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+        self._channel.unsubscribe(callback)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return self._channel.unary_unary(method, *args, **kwargs)
+
+    def unary_stream(self, method, *args, **kwargs):
+        return self._channel.unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return self._channel.stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return self._channel.stream_stream(method, *args, **kwargs)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            callbacks, self._callbacks = self._callbacks, []
+        # As grpc.Channel.close() does, drop this handle's subscriptions.
+        for callback in callbacks:
+            self._channel.unsubscribe(callback)
+        _release_channel(self._channel)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def _shared_channel(key, create: Callable[[], grpc.Channel]) -> grpc.Channel:
+    """Return a handle on the cached channel for ``key``.
+
+    The channel is created with ``create`` if it is not cached yet. If
+    ``key`` is not hashable the new channel is returned as is, uncached.
+    """
+    try:
+        hash(key)
+    except TypeError:
+        return create()
+
+    with _CHANNEL_CACHE_LOCK:
+        channel = _CHANNEL_CACHE.get(key)
+        if channel is not None:
+            _CHANNEL_CACHE.move_to_end(key)
+            _CHANNEL_REFS[channel] += 1
+            return _SharedChannel(channel)
+
+    # Create the channel without holding the lock, so that other transports
+    # are not held up behind it.
+    created = create()
+    with _CHANNEL_CACHE_LOCK:
+        channel = _CHANNEL_CACHE.get(key)
+        if channel is None:
+            channel = created
+            _CHANNEL_CACHE[key] = channel
+            _CHANNEL_REFS[channel] = 0
+            if len(_CHANNEL_CACHE) > _CHANNEL_CACHE_SIZE:
+                # The evicted channel may still be in use; it is closed when
+                # its last handle is.
+                _CHANNEL_CACHE.popitem(last=False)
+        _CHANNEL_REFS[channel] += 1
+    if channel is not created:
+        # Another transport created the same channel first; use that one.
+        created.close()
+    return _SharedChannel(channel)
+
+
+class _PooledUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    """Dispatch a unary-unary RPC round-robin over a pool of channels."""
+
+    def __init__(self, multicallables: Sequence[grpc.UnaryUnaryMultiCallable]) -> None:
+        # next() on a cycle is atomic under the GIL, so no lock is needed.
+        self._next = itertools.cycle(multicallables).__next__
+
+    def __call__(self, request, **kwargs):
+        return self._next()(request, **kwargs)
+
+    def with_call(self, request, **kwargs):
+        return self._next().with_call(request, **kwargs)
+
+    def future(self, request, **kwargs):
+        return self._next().future(request, **kwargs)
+
+
 class AccessApprovalGrpcTransport(AccessApprovalTransport):
     """gRPC backend transport for AccessApproval.
 
@@ -78,7 +432,14 @@ class AccessApprovalGrpcTransport(AccessApprovalTransport):
     top of HTTP/2); the ``grpcio`` package must be installed.
     """
 
-    _stubs: Dict[str, Callable]
+    __slots__ = (
+        "_grpc_channel",
+        "_channel_pool",
+        "_channel_pool_size",
+        "_channel_key",
+        "_ready",
+        "_owns_channels",
+    ) + tuple("_" + rpc[0] for rpc in _RPCS)
 
     def __init__(
         self,
@@ -90,7 +451,9 @@ class AccessApprovalGrpcTransport(AccessApprovalTransport):
         channel: grpc.Channel = None,
         api_mtls_endpoint: str = None,
         client_cert_source: Callable[[], Tuple[bytes, bytes]] = None,
-        quota_project_id: Optional[str] = None
+        quota_project_id: Optional[str] = None,
+        channel_pool_size: int = 1,
+        warmup_timeout: Optional[float] = None
     ) -> None:
         """Instantiate the transport.
 
@@ -119,20 +482,50 @@ class AccessApprovalGrpcTransport(AccessApprovalTransport):
                 is None.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            channel_pool_size (Optional[int]): The number of channels to open
+                to the service. RPCs are spread round-robin across them, so
+                that concurrent calls are not limited by the stream cap of a
+                single HTTP/2 connection. Ignored if ``channel`` is provided.
+            warmup_timeout (Optional[float]): If provided, wait up to this
+                many seconds for every channel to connect before returning.
+                Otherwise the channels connect in the background.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
               creation failed for any reason.
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
+          grpc.FutureTimeoutError: If ``warmup_timeout`` is provided and a
+              channel did not connect in time.
         """
+        self._grpc_channel = None  # type: Optional[grpc.Channel]
+        self._channel_pool = []  # type: List[grpc.Channel]
+        self._ready = []  # type: List[grpc.Future]
+        # A channel passed in by the caller may be used elsewhere too, so it
+        # is only closed by an explicit call to close().
+        self._owns_channels = not channel
+
+        resolved_scopes = scopes or self.AUTH_SCOPES
+        # Transports created with the same arguments share their channels.
+        # Key on the arguments as given: resolving default credentials
+        # returns a new object every time.
+        self._channel_key = (
+            host,
+            credentials,
+            credentials_file,
+            tuple(resolved_scopes),
+            quota_project_id,
+        )
+        skip_credentials = False
         if channel:
-            # Sanity check: Ensure that channel and credentials are not both
-            # provided.
-            credentials = False
+            # Sanity check: The channel carries its own credentials, so
+            # ignore any that were provided.
+            credentials = None
+            skip_credentials = True
 
             # If a channel was explicitly provided, set it.
             self._grpc_channel = channel
+            self._channel_pool = [channel]
         elif api_mtls_endpoint:
             host = (
                 api_mtls_endpoint
@@ -142,7 +535,7 @@ class AccessApprovalGrpcTransport(AccessApprovalTransport):
 
             if credentials is None:
                 credentials, _ = auth.default(
-                    scopes=self.AUTH_SCOPES, quota_project_id=quota_project_id
+                    scopes=resolved_scopes, quota_project_id=quota_project_id
                 )
 
             # Create SSL credentials with client_cert_source or application
@@ -155,27 +548,53 @@ class AccessApprovalGrpcTransport(AccessApprovalTransport):
             else:
                 ssl_credentials = SslCredentials().ssl_credentials
 
-            # create a new channel. The provided one is ignored.
-            self._grpc_channel = type(self).create_channel(
+            # create a new channel. The provided one is ignored. The SSL
+            # credentials are a new object every time, so mTLS channels are
+            # not cached.
+            self._channel_pool = self._create_channel_pool(
                 host,
+                channel_pool_size,
+                None,
                 credentials=credentials,
                 credentials_file=credentials_file,
                 ssl_credentials=ssl_credentials,
-                scopes=scopes or self.AUTH_SCOPES,
+                scopes=resolved_scopes,
                 quota_project_id=quota_project_id,
             )
+            self._grpc_channel = self._channel_pool[0]
 
-        self._stubs = {}  # type: Dict[str, Callable]
+        self._channel_pool_size = channel_pool_size
 
         # Run the base constructor.
         super().__init__(
             host=host,
             credentials=credentials,
             credentials_file=credentials_file,
-            scopes=scopes or self.AUTH_SCOPES,
+            scopes=resolved_scopes,
             quota_project_id=quota_project_id,
+            skip_credentials=skip_credentials,
         )
 
+        # Start connecting now, so that the TLS and HTTP/2 handshakes overlap
+        # with the rest of the caller's setup instead of delaying the first
+        # RPC.
+        self._ready = [
+            grpc.channel_ready_future(channel) for channel in self._channel_pool
+        ]
+        if warmup_timeout is not None:
+            try:
+                for ready in self._ready:
+                    ready.result(timeout=warmup_timeout)
+            except grpc.FutureTimeoutError:
+                if self._owns_channels:
+                    self.close()
+                else:
+                    # Leave the caller's channel open, as close() would not.
+                    for ready in self._ready:
+                        ready.cancel()
+                    self._ready = []
+                raise
+
     @classmethod
     def create_channel(
         cls,
@@ -204,6 +623,7 @@ class AccessApprovalGrpcTransport(AccessApprovalTransport):
                 and quota.
             kwargs (Optional[dict]): Keyword arguments, which are passed to the
                 channel creation.
+
         Returns:
             grpc.Channel: A gRPC channel object.
 
@@ -212,6 +632,14 @@ class AccessApprovalGrpcTransport(AccessApprovalTransport):
               and ``credentials_file`` are passed.
         """
         scopes = scopes or cls.AUTH_SCOPES
+
+        options = list(kwargs.pop("options", []))
+        overridden = {name for name, _ in options}
+        options.extend(
+            option for option in _DEFAULT_CHANNEL_OPTIONS if option[0] not in overridden
+        )
+        kwargs["options"] = options
+
         return grpc_helpers.create_channel(
             host,
             credentials=credentials,
@@ -221,252 +649,146 @@ class AccessApprovalGrpcTransport(AccessApprovalTransport):
             **kwargs
         )
 
-    @property
-    def grpc_channel(self) -> grpc.Channel:
-        """Create the channel designed to connect to this service.
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every channel in the process-wide channel cache.
 
-        This property caches on the instance; repeated calls return
-        the same channel.
+        Transports still using one of these channels can no longer make
+        calls; this is meant for process teardown.
         """
-        # Sanity check: Only create a new channel if we do not already
-        # have one.
-        if not hasattr(self, "_grpc_channel"):
-            self._grpc_channel = self.create_channel(
-                self._host, credentials=self._credentials,
-            )
-
-        # Return the channel from cache.
-        return self._grpc_channel
-
-    @property
-    def list_approval_requests(
-        self,
-    ) -> Callable[
-        [accessapproval.ListApprovalRequestsMessage],
-        accessapproval.ListApprovalRequestsResponse,
-    ]:
-        r"""Return a callable for the list approval requests method over gRPC.
-
-        Lists approval requests associated with a project,
-        folder, or organization. Approval requests can be
-        filtered by state (pending, active, dismissed). The
-        order is reverse chronological.
-
-        Returns:
-            Callable[[~.ListApprovalRequestsMessage],
-                    ~.ListApprovalRequestsResponse]:
-                A function that, when called, will call the underlying RPC
-                on the server.
+        with _CHANNEL_CACHE_LOCK:
+            channels = list(_CHANNEL_CACHE.values())
+            _CHANNEL_CACHE.clear()
+            _CHANNEL_REFS.clear()
+        for channel in channels:
+            channel.close()
+
+    def close(self) -> None:
+        """Close the channels used by this transport.
+
+        A channel shared with other transports through the channel cache is
+        only closed once every transport using it has been closed.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "list_approval_requests" not in self._stubs:
-            self._stubs["list_approval_requests"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/ListApprovalRequests",
-                request_serializer=accessapproval.ListApprovalRequestsMessage.serialize,
-                response_deserializer=accessapproval.ListApprovalRequestsResponse.deserialize,
-            )
-        return self._stubs["list_approval_requests"]
+        ready, pool = self._ready, self._channel_pool
+        self._ready = []
+        self._channel_pool = []
+        self._grpc_channel = None
+        _close_pool(ready, pool)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __del__(self):
+        # Best effort only. Channels still connecting are left alone: closing
+        # them, or even cancelling their ready futures, takes locks that
+        # gRPC's polling thread may hold, and during interpreter shutdown
+        # that thread never releases them.
+        if getattr(self, "_owns_channels", False) and all(
+            ready.done() for ready in getattr(self, "_ready", [])
+        ):
+            try:
+                self.close()
+            except Exception:
+                pass
 
     @property
-    def get_approval_request(
-        self,
-    ) -> Callable[
-        [accessapproval.GetApprovalRequestMessage], accessapproval.ApprovalRequest
-    ]:
-        r"""Return a callable for the get approval request method over gRPC.
+    def grpc_channel(self) -> grpc.Channel:
+        """Return the channel designed to connect to this service.
 
-        Gets an approval request. Returns NOT_FOUND if the request does
-        not exist.
+        The channel is created when the transport is, so repeated calls
+        return the same channel.
 
-        Returns:
-            Callable[[~.GetApprovalRequestMessage],
-                    ~.ApprovalRequest]:
-                A function that, when called, will call the underlying RPC
-                on the server.
+        Unless the channel was provided or created for mutual TLS, it is a
+        handle on a channel shared with other transports through the
+        channel cache, not the channel returned by :meth:`create_channel`.
+        Closing the handle only releases this transport's use of the shared
+        channel, which is closed once no transport uses it.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "get_approval_request" not in self._stubs:
-            self._stubs["get_approval_request"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/GetApprovalRequest",
-                request_serializer=accessapproval.GetApprovalRequestMessage.serialize,
-                response_deserializer=accessapproval.ApprovalRequest.deserialize,
-            )
-        return self._stubs["get_approval_request"]
-
-    @property
-    def approve_approval_request(
-        self,
-    ) -> Callable[
-        [accessapproval.ApproveApprovalRequestMessage], accessapproval.ApprovalRequest
-    ]:
-        r"""Return a callable for the approve approval request method over gRPC.
-
-        Approves a request and returns the updated ApprovalRequest.
-
-        Returns NOT_FOUND if the request does not exist. Returns
-        FAILED_PRECONDITION if the request exists but is not in a
-        pending state.
+        return self._grpc_channel
 
-        Returns:
-            Callable[[~.ApproveApprovalRequestMessage],
-                    ~.ApprovalRequest]:
-                A function that, when called, will call the underlying RPC
-                on the server.
+    def _create_channel_pool(
+        self, host: str, size: int, key: Optional[tuple], **kwargs
+    ) -> List[grpc.Channel]:
+        """Create ``size`` channels to ``host``.
+
+        Unless ``key`` is None, the channels are shared with other
+        transports whose pools were created with the same ``key``, so that
+        short-lived transports do not each pay for a new connection. Every
+        channel past the first gets a distinguishing channel argument, so
+        that gRPC does not share one subchannel (and hence one HTTP/2
+        connection) between them.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "approve_approval_request" not in self._stubs:
-            self._stubs["approve_approval_request"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/ApproveApprovalRequest",
-                request_serializer=accessapproval.ApproveApprovalRequestMessage.serialize,
-                response_deserializer=accessapproval.ApprovalRequest.deserialize,
+        pool = []
+        for i in range(size):
+            if i:
+                kwargs["options"] = [("grpc.channel_id", i)]
+            create = functools.partial(type(self).create_channel, host, **kwargs)
+            if key is None:
+                pool.append(create())
+            else:
+                pool.append(_shared_channel((type(self), key, i), create))
+        return pool
+
+    def _post_credentials_init(self):
+        # Create the channels now that the credentials are resolved, unless
+        # they were provided or created for mTLS.
+        if self._grpc_channel is None:
+            self._channel_pool = self._create_channel_pool(
+                self._host,
+                self._channel_pool_size,
+                self._channel_key,
+                credentials=self._credentials,
             )
-        return self._stubs["approve_approval_request"]
-
-    @property
-    def dismiss_approval_request(
-        self,
-    ) -> Callable[
-        [accessapproval.DismissApprovalRequestMessage], accessapproval.ApprovalRequest
-    ]:
-        r"""Return a callable for the dismiss approval request method over gRPC.
-
-        Dismisses a request. Returns the updated ApprovalRequest.
-
-        NOTE: This does not deny access to the resource if another
-        request has been made and approved. It is equivalent in effect
-        to ignoring the request altogether.
-
-        Returns NOT_FOUND if the request does not exist.
-
-        Returns FAILED_PRECONDITION if the request exists but is not in
-        a pending state.
-
-        Returns:
-            Callable[[~.DismissApprovalRequestMessage],
-                    ~.ApprovalRequest]:
-                A function that, when called, will call the underlying RPC
-                on the server.
-        """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "dismiss_approval_request" not in self._stubs:
-            self._stubs["dismiss_approval_request"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/DismissApprovalRequest",
-                request_serializer=accessapproval.DismissApprovalRequestMessage.serialize,
-                response_deserializer=accessapproval.ApprovalRequest.deserialize,
+            self._grpc_channel = self._channel_pool[0]
+
+        # Build every stub once, up front, so that the properties below are
+        # plain attribute reads. The base class wraps them right after.
+        for name, path, request_serializer, response_deserializer, _, _ in _RPCS:
+            setattr(
+                self,
+                "_" + name,
+                self._unary_unary(path, request_serializer, response_deserializer),
             )
-        return self._stubs["dismiss_approval_request"]
 
-    @property
-    def get_access_approval_settings(
-        self,
-    ) -> Callable[
-        [accessapproval.GetAccessApprovalSettingsMessage],
-        accessapproval.AccessApprovalSettings,
-    ]:
-        r"""Return a callable for the get access approval settings method over gRPC.
-
-        Gets the settings associated with a project, folder,
-        or organization.
-
-        Returns:
-            Callable[[~.GetAccessApprovalSettingsMessage],
-                    ~.AccessApprovalSettings]:
-                A function that, when called, will call the underlying RPC
-                on the server.
-        """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "get_access_approval_settings" not in self._stubs:
-            self._stubs["get_access_approval_settings"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/GetAccessApprovalSettings",
-                request_serializer=accessapproval.GetAccessApprovalSettingsMessage.serialize,
-                response_deserializer=accessapproval.AccessApprovalSettings.deserialize,
+    def _unary_unary(
+        self, method: str, request_serializer, response_deserializer
+    ) -> Callable:
+        """Bind a unary-unary RPC on every channel in the pool."""
+        multicallables = [
+            channel.unary_unary(
+                method,
+                request_serializer=request_serializer,
+                response_deserializer=response_deserializer,
             )
-        return self._stubs["get_access_approval_settings"]
+            for channel in self._channel_pool
+        ]
+        if len(multicallables) == 1:
+            return multicallables[0]
+        return _PooledUnaryUnaryMultiCallable(multicallables)
 
-    @property
-    def update_access_approval_settings(
-        self,
-    ) -> Callable[
-        [accessapproval.UpdateAccessApprovalSettingsMessage],
-        accessapproval.AccessApprovalSettings,
-    ]:
-        r"""Return a callable for the update access approval
-        settings method over gRPC.
 
-        Updates the settings associated with a project, folder, or
-        organization. Settings to update are determined by the value of
-        field_mask.
+def _make_stub_property(name: str, stub_type: Any, doc: str) -> property:
+    """Return the accessor for the stub of the RPC called ``name``."""
+    get_stub = operator.attrgetter("_" + name)
 
-        Returns:
-            Callable[[~.UpdateAccessApprovalSettingsMessage],
-                    ~.AccessApprovalSettings]:
-                A function that, when called, will call the underlying RPC
-                on the server.
-        """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "update_access_approval_settings" not in self._stubs:
-            self._stubs[
-                "update_access_approval_settings"
-            ] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/UpdateAccessApprovalSettings",
-                request_serializer=accessapproval.UpdateAccessApprovalSettingsMessage.serialize,
-                response_deserializer=accessapproval.AccessApprovalSettings.deserialize,
-            )
-        return self._stubs["update_access_approval_settings"]
+    def stub(self) -> stub_type:
+        return get_stub(self)
 
-    @property
-    def delete_access_approval_settings(
-        self,
-    ) -> Callable[[accessapproval.DeleteAccessApprovalSettingsMessage], empty.Empty]:
-        r"""Return a callable for the delete access approval
-        settings method over gRPC.
+    stub.__name__ = name
+    stub.__qualname__ = "AccessApprovalGrpcTransport." + name
+    stub.__doc__ = doc
+    return property(stub)
 
-        Deletes the settings associated with a project,
-        folder, or organization. This will have the effect of
-        disabling Access Approval for the project, folder, or
-        organization, but only if all ancestors also have Access
-        Approval disabled. If Access Approval is enabled at a
-        higher level of the hierarchy, then Access Approval will
-        still be enabled at this level as the settings are
-        inherited.
 
-        Returns:
-            Callable[[~.DeleteAccessApprovalSettingsMessage],
-                    ~.Empty]:
-                A function that, when called, will call the underlying RPC
-                on the server.
-        """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "delete_access_approval_settings" not in self._stubs:
-            self._stubs[
-                "delete_access_approval_settings"
-            ] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/DeleteAccessApprovalSettings",
-                request_serializer=accessapproval.DeleteAccessApprovalSettingsMessage.serialize,
-                response_deserializer=empty.Empty.FromString,
-            )
-        return self._stubs["delete_access_approval_settings"]
+for _name, _, _, _, _stub_type, _doc in _RPCS:
+    setattr(
+        AccessApprovalGrpcTransport,
+        _name,
+        _make_stub_property(_name, _stub_type, _doc),
+    )
 
 
 __all__ = ("AccessApprovalGrpcTransport",)
@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple
+from typing import Awaitable, Callable, Optional, Sequence, Tuple
 
 from google.api_core import grpc_helpers_async  # type: ignore
 from google.auth import credentials  # type: ignore
@@ -28,7 +28,7 @@ from google.cloud.accessapproval_v1.types import accessapproval
 from google.protobuf import empty_pb2 as empty  # type: ignore
 
 from .base import AccessApprovalTransport
-from .grpc import AccessApprovalGrpcTransport
+from .grpc import AccessApprovalGrpcTransport, _RPCS
 
 
 class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
@@ -78,8 +78,7 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
     top of HTTP/2); the ``grpcio`` package must be installed.
     """
 
-    _grpc_channel: aio.Channel
-    _stubs: Dict[str, Callable] = {}
+    _grpc_channel: Optional[aio.Channel]
 
     @classmethod
     def create_channel(
@@ -169,10 +168,15 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        self._grpc_channel = None
+
+        resolved_scopes = scopes or self.AUTH_SCOPES
+        skip_credentials = False
         if channel:
-            # Sanity check: Ensure that channel and credentials are not both
-            # provided.
-            credentials = False
+            # Sanity check: The channel carries its own credentials, so
+            # ignore any that were provided.
+            credentials = None
+            skip_credentials = True
 
             # If a channel was explicitly provided, set it.
             self._grpc_channel = channel
@@ -199,7 +203,7 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
                 credentials=credentials,
                 credentials_file=credentials_file,
                 ssl_credentials=ssl_credentials,
-                scopes=scopes or self.AUTH_SCOPES,
+                scopes=resolved_scopes,
                 quota_project_id=quota_project_id,
             )
 
@@ -208,28 +212,40 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
             host=host,
             credentials=credentials,
             credentials_file=credentials_file,
-            scopes=scopes or self.AUTH_SCOPES,
+            scopes=resolved_scopes,
             quota_project_id=quota_project_id,
+            skip_credentials=skip_credentials,
         )
 
-        self._stubs = {}
-
     @property
     def grpc_channel(self) -> aio.Channel:
-        """Create the channel designed to connect to this service.
+        """Return the channel designed to connect to this service.
 
-        This property caches on the instance; repeated calls return
-        the same channel.
+        The channel is created when the transport is, so repeated calls
+        return the same channel.
         """
-        # Sanity check: Only create a new channel if we do not already
-        # have one.
-        if not hasattr(self, "_grpc_channel"):
+        return self._grpc_channel
+
+    def _post_credentials_init(self):
+        # Create the channel now that the credentials are resolved, unless it
+        # was provided or created for mTLS.
+        if self._grpc_channel is None:
             self._grpc_channel = self.create_channel(
                 self._host, credentials=self._credentials,
             )
 
-        # Return the channel from cache.
-        return self._grpc_channel
+        # Build every stub once, up front, so that the properties below are
+        # plain attribute reads. The base class wraps them right after.
+        for name, path, request_serializer, response_deserializer, _, _ in _RPCS:
+            setattr(
+                self,
+                "_" + name,
+                self._grpc_channel.unary_unary(
+                    path,
+                    request_serializer=request_serializer,
+                    response_deserializer=response_deserializer,
+                ),
+            )
 
     @property
     def list_approval_requests(
@@ -251,17 +267,7 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
                 A function that, when called, will call the underlying RPC
                 on the server.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "list_approval_requests" not in self._stubs:
-            self._stubs["list_approval_requests"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/ListApprovalRequests",
-                request_serializer=accessapproval.ListApprovalRequestsMessage.serialize,
-                response_deserializer=accessapproval.ListApprovalRequestsResponse.deserialize,
-            )
-        return self._stubs["list_approval_requests"]
+        return self._list_approval_requests
 
     @property
     def get_approval_request(
@@ -281,17 +287,7 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
                 A function that, when called, will call the underlying RPC
                 on the server.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "get_approval_request" not in self._stubs:
-            self._stubs["get_approval_request"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/GetApprovalRequest",
-                request_serializer=accessapproval.GetApprovalRequestMessage.serialize,
-                response_deserializer=accessapproval.ApprovalRequest.deserialize,
-            )
-        return self._stubs["get_approval_request"]
+        return self._get_approval_request
 
     @property
     def approve_approval_request(
@@ -314,17 +310,7 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
                 A function that, when called, will call the underlying RPC
                 on the server.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "approve_approval_request" not in self._stubs:
-            self._stubs["approve_approval_request"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/ApproveApprovalRequest",
-                request_serializer=accessapproval.ApproveApprovalRequestMessage.serialize,
-                response_deserializer=accessapproval.ApprovalRequest.deserialize,
-            )
-        return self._stubs["approve_approval_request"]
+        return self._approve_approval_request
 
     @property
     def dismiss_approval_request(
@@ -352,17 +338,7 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
                 A function that, when called, will call the underlying RPC
                 on the server.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "dismiss_approval_request" not in self._stubs:
-            self._stubs["dismiss_approval_request"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/DismissApprovalRequest",
-                request_serializer=accessapproval.DismissApprovalRequestMessage.serialize,
-                response_deserializer=accessapproval.ApprovalRequest.deserialize,
-            )
-        return self._stubs["dismiss_approval_request"]
+        return self._dismiss_approval_request
 
     @property
     def get_access_approval_settings(
@@ -382,17 +358,7 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
                 A function that, when called, will call the underlying RPC
                 on the server.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "get_access_approval_settings" not in self._stubs:
-            self._stubs["get_access_approval_settings"] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/GetAccessApprovalSettings",
-                request_serializer=accessapproval.GetAccessApprovalSettingsMessage.serialize,
-                response_deserializer=accessapproval.AccessApprovalSettings.deserialize,
-            )
-        return self._stubs["get_access_approval_settings"]
+        return self._get_access_approval_settings
 
     @property
     def update_access_approval_settings(
@@ -414,19 +380,7 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
                 A function that, when called, will call the underlying RPC
                 on the server.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "update_access_approval_settings" not in self._stubs:
-            self._stubs[
-                "update_access_approval_settings"
-            ] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/UpdateAccessApprovalSettings",
-                request_serializer=accessapproval.UpdateAccessApprovalSettingsMessage.serialize,
-                response_deserializer=accessapproval.AccessApprovalSettings.deserialize,
-            )
-        return self._stubs["update_access_approval_settings"]
+        return self._update_access_approval_settings
 
     @property
     def delete_access_approval_settings(
@@ -452,19 +406,7 @@ class AccessApprovalGrpcAsyncIOTransport(AccessApprovalTransport):
                 A function that, when called, will call the underlying RPC
                 on the server.
         """
-        # Generate a "stub function" on-the-fly which will actually make
-        # the request.
-        # gRPC handles serialization and deserialization, so we just need
-        # to pass in the functions for each.
-        if "delete_access_approval_settings" not in self._stubs:
-            self._stubs[
-                "delete_access_approval_settings"
-            ] = self.grpc_channel.unary_unary(
-                "/google.cloud.accessapproval.v1.AccessApproval/DeleteAccessApprovalSettings",
-                request_serializer=accessapproval.DeleteAccessApprovalSettingsMessage.serialize,
-                response_deserializer=empty.Empty.FromString,
-            )
-        return self._stubs["delete_access_approval_settings"]
+        return self._delete_access_approval_settings
 
 
 __all__ = ("AccessApprovalGrpcAsyncIOTransport",)
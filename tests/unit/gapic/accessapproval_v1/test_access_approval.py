@@ -17,6 +17,9 @@
 
 import os
 import mock
+import subprocess
+import sys
+import typing
 
 import grpc
 from grpc.experimental import aio
@@ -38,6 +41,9 @@ from google.cloud.accessapproval_v1.services.access_approval import (
 from google.cloud.accessapproval_v1.services.access_approval import AccessApprovalClient
 from google.cloud.accessapproval_v1.services.access_approval import pagers
 from google.cloud.accessapproval_v1.services.access_approval import transports
+from google.cloud.accessapproval_v1.services.access_approval.transports import (
+    grpc as transports_grpc,
+)
 from google.cloud.accessapproval_v1.types import accessapproval
 from google.oauth2 import service_account
 from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
@@ -59,6 +65,16 @@ def modify_default_endpoint(client):
     )
 
 
+@pytest.fixture(autouse=True)
+def clear_channel_cache():
+    # The gRPC transport caches channels process-wide; start every test with
+    # an empty cache.
+    with mock.patch.dict(transports_grpc._CHANNEL_CACHE, clear=True), mock.patch.dict(
+        transports_grpc._CHANNEL_REFS, clear=True
+    ):
+        yield
+
+
 def test__get_default_mtls_endpoint():
     api_endpoint = "example.googleapis.com"
     api_mtls_endpoint = "example.mtls.googleapis.com"
@@ -2015,6 +2031,193 @@ def test_access_approval_grpc_transport_channel():
     assert not callback.called
 
 
+def test_access_approval_grpc_transport_intercepted_channel():
+    # Check that client interceptors see the method path as a str.
+    methods = []
+
+    class Interceptor(grpc.UnaryUnaryClientInterceptor):
+        def intercept_unary_unary(self, continuation, client_call_details, request):
+            methods.append(client_call_details.method)
+            return continuation(client_call_details, request)
+
+    channel = grpc.intercept_channel(
+        grpc.insecure_channel("localhost:1"), Interceptor()
+    )
+    transport = transports.AccessApprovalGrpcTransport(channel=channel)
+    with pytest.raises(grpc.RpcError):
+        transport.get_approval_request(
+            accessapproval.GetApprovalRequestMessage(), timeout=5
+        )
+    assert methods == [
+        "/google.cloud.accessapproval.v1.AccessApproval/GetApprovalRequest"
+    ]
+    transport.close()
+
+
+@mock.patch("google.api_core.grpc_helpers.create_channel", autospec=True)
+def test_access_approval_grpc_transport_close(grpc_create_channel):
+    # Check that a shared channel is closed by the last transport using it.
+    channel = grpc_create_channel.return_value
+    cred = credentials.AnonymousCredentials()
+    transport = transports.AccessApprovalGrpcTransport(credentials=cred)
+    with transports.AccessApprovalGrpcTransport(credentials=cred):
+        pass
+    channel.close.assert_not_called()
+
+    transport.close()
+    channel.close.assert_called_once_with()
+
+
+def test_access_approval_grpc_transport_del():
+    # Check that garbage collection closes the transport's own channel, but
+    # not one provided by the caller.
+    channel = mock.Mock()
+    with mock.patch.object(grpc, "channel_ready_future"), mock.patch(
+        "google.api_core.grpc_helpers.create_channel", autospec=True
+    ) as grpc_create_channel:
+        transport = transports.AccessApprovalGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+        )
+        del transport
+        grpc_create_channel.return_value.close.assert_called_once_with()
+
+        transport = transports.AccessApprovalGrpcTransport(channel=channel)
+        del transport
+        channel.close.assert_not_called()
+
+
+@mock.patch("google.api_core.grpc_helpers.create_channel", autospec=True)
+def test_access_approval_grpc_transport_close_while_connecting(grpc_create_channel):
+    # Check that close() cancels a pending ready future, which unsubscribes
+    # it from the channel, before closing the channel.
+    channel = grpc_create_channel.return_value
+    order = []
+    channel.close.side_effect = lambda: order.append("close")
+    with mock.patch.object(grpc, "channel_ready_future") as ready:
+        ready.return_value.done.return_value = False
+        ready.return_value.cancel.side_effect = lambda: order.append("cancel")
+
+        transport = transports.AccessApprovalGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+        )
+        transport.close()
+        assert order == ["cancel", "close"]
+
+        # Garbage collection leaves a channel that is still connecting alone.
+        order.clear()
+        transport = transports.AccessApprovalGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+        )
+        del transport
+        assert order == []
+
+
+def test_access_approval_grpc_transport_interpreter_exit():
+    # Check that a transport still connecting when the interpreter exits
+    # does not keep it from exiting.
+    script = (
+        "from google.auth import credentials\n"
+        "from google.cloud.accessapproval_v1.services.access_approval import "
+        "transports\n"
+        "transport = transports.AccessApprovalGrpcTransport(\n"
+        "    host='localhost:1', credentials=credentials.AnonymousCredentials()\n"
+        ")\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=60)
+
+
+@pytest.mark.parametrize(
+    "transport_class",
+    [
+        transports.AccessApprovalGrpcTransport,
+        transports.AccessApprovalGrpcAsyncIOTransport,
+    ],
+)
+def test_access_approval_transport_channel_skips_credentials(transport_class):
+    # Check that credentials are not looked up when a channel is provided.
+    with mock.patch.object(auth, "default") as adc, mock.patch.object(
+        auth, "load_credentials_from_file"
+    ) as load_creds:
+        transport = transport_class(
+            channel=mock.Mock(), credentials_file="credentials.json"
+        )
+        adc.assert_not_called()
+        load_creds.assert_not_called()
+    assert transport._credentials is None
+
+
+@mock.patch("google.api_core.grpc_helpers.create_channel", autospec=True)
+def test_access_approval_grpc_transport_post_credentials_init(grpc_create_channel):
+    # Check that the channel and stubs are set up even if a subclass
+    # replaces _prep_wrapped_messages.
+    class Transport(transports.AccessApprovalGrpcTransport):
+        def _prep_wrapped_messages(self):
+            pass
+
+    transport = Transport(credentials=credentials.AnonymousCredentials())
+    channel = grpc_create_channel.return_value
+    assert transport.grpc_channel._channel == channel
+    assert transport.get_approval_request == channel.unary_unary.return_value
+
+
+def test_access_approval_grpc_transport_stub_accessors():
+    # The generated stub accessors keep their documentation and types.
+    accessor = transports.AccessApprovalGrpcTransport.get_approval_request
+    assert accessor.__doc__.startswith(
+        "Return a callable for the get approval request method over gRPC."
+    )
+    assert (
+        typing.get_type_hints(accessor.fget)["return"]
+        == typing.Callable[
+            [accessapproval.GetApprovalRequestMessage], accessapproval.ApprovalRequest
+        ]
+    )
+
+
+def test_access_approval_grpc_transport_slots():
+    # The gRPC transport keeps its state in slots rather than an instance dict.
+    transport = transports.AccessApprovalGrpcTransport(channel=mock.Mock())
+    assert not hasattr(transport, "__dict__")
+
+
+def test_access_approval_grpc_transport_warmup():
+    # Check that the channel starts connecting when the transport is created,
+    # and that warmup_timeout waits for it.
+    channel = mock.Mock()
+    with mock.patch.object(grpc, "channel_ready_future") as ready:
+        transports.AccessApprovalGrpcTransport(channel=channel)
+        ready.assert_called_once_with(channel)
+        ready.return_value.result.assert_not_called()
+
+        transports.AccessApprovalGrpcTransport(channel=channel, warmup_timeout=5)
+        ready.return_value.result.assert_called_once_with(timeout=5)
+
+
+@mock.patch("google.api_core.grpc_helpers.create_channel", autospec=True)
+def test_access_approval_grpc_transport_warmup_timeout(grpc_create_channel):
+    # Check that the channels are closed if they do not connect in time.
+    with mock.patch.object(grpc, "channel_ready_future") as ready:
+        ready.return_value.result.side_effect = grpc.FutureTimeoutError()
+        with pytest.raises(grpc.FutureTimeoutError):
+            transports.AccessApprovalGrpcTransport(
+                credentials=credentials.AnonymousCredentials(), warmup_timeout=5
+            )
+        ready.return_value.cancel.assert_called_once_with()
+    grpc_create_channel.return_value.close.assert_called_once_with()
+
+
+def test_access_approval_grpc_transport_warmup_timeout_channel():
+    # Check that a channel provided by the caller is left open if it does
+    # not connect in time.
+    channel = mock.Mock()
+    with mock.patch.object(grpc, "channel_ready_future") as ready:
+        ready.return_value.result.side_effect = grpc.FutureTimeoutError()
+        with pytest.raises(grpc.FutureTimeoutError):
+            transports.AccessApprovalGrpcTransport(channel=channel, warmup_timeout=5)
+        ready.return_value.cancel.assert_called_once_with()
+    channel.close.assert_not_called()
+
+
 def test_access_approval_grpc_asyncio_transport_channel():
     channel = aio.insecure_channel("http://localhost/")
 
@@ -2032,6 +2235,117 @@ def test_access_approval_grpc_asyncio_transport_channel():
     assert not callback.called
 
 
+@mock.patch("google.api_core.grpc_helpers.create_channel", autospec=True)
+def test_access_approval_grpc_transport_channel_pool(grpc_create_channel):
+    # Check that a pool of channels is created and RPCs alternate between them.
+    channels = [mock.Mock(), mock.Mock()]
+    grpc_create_channel.side_effect = channels
+
+    transport = transports.AccessApprovalGrpcTransport(
+        credentials=credentials.AnonymousCredentials(), channel_pool_size=2,
+    )
+    assert grpc_create_channel.call_count == 2
+    _, _, kwargs = grpc_create_channel.mock_calls[1]
+    assert kwargs["options"][0] == ("grpc.channel_id", 1)
+    assert transport.grpc_channel._channel == channels[0]
+
+    for _ in range(3):
+        transport.get_approval_request(accessapproval.GetApprovalRequestMessage())
+    assert channels[0].unary_unary.return_value.call_count == 2
+    assert channels[1].unary_unary.return_value.call_count == 1
+
+    # with_call() and future() take their turn in the rotation too.
+    request = accessapproval.GetApprovalRequestMessage()
+    transport.get_approval_request.with_call(request, timeout=5)
+    transport.get_approval_request.future(request)
+    channels[1].unary_unary.return_value.with_call.assert_called_once_with(
+        request, timeout=5
+    )
+    channels[0].unary_unary.return_value.future.assert_called_once_with(request)
+
+    # Stubs bound before close() keep dispatching over the pool, leaving it
+    # to gRPC to reject calls on the closed channels.
+    stub = transport.get_approval_request
+    transport.close()
+    stub(accessapproval.GetApprovalRequestMessage())
+    assert channels[1].unary_unary.return_value.call_count == 2
+
+
+@mock.patch("google.api_core.grpc_helpers.create_channel", autospec=True)
+def test_access_approval_grpc_transport_channel_cache(grpc_create_channel):
+    # Check that transports created with the same arguments share a channel.
+    cred = credentials.AnonymousCredentials()
+    transport1 = transports.AccessApprovalGrpcTransport(credentials=cred)
+    transport2 = transports.AccessApprovalGrpcTransport(credentials=cred)
+    assert grpc_create_channel.call_count == 1
+    assert transport1.grpc_channel._channel == transport2.grpc_channel._channel
+
+    transports.AccessApprovalGrpcTransport.close_all()
+    grpc_create_channel.return_value.close.assert_called_once_with()
+
+    transports.AccessApprovalGrpcTransport(credentials=cred)
+    assert grpc_create_channel.call_count == 2
+
+
+@mock.patch("google.api_core.grpc_helpers.create_channel", autospec=True)
+def test_access_approval_grpc_transport_channel_cache_adc(grpc_create_channel):
+    # Check that transports using default credentials share a channel, even
+    # though each one resolves its own credentials object.
+    with mock.patch.object(auth, "default") as adc:
+        adc.side_effect = lambda **kwargs: (credentials.AnonymousCredentials(), None)
+        transport1 = transports.AccessApprovalGrpcTransport()
+        transport2 = transports.AccessApprovalGrpcTransport()
+    assert grpc_create_channel.call_count == 1
+    assert transport1.grpc_channel._channel == transport2.grpc_channel._channel
+
+
+def test_access_approval_grpc_transport_channel_cache_race():
+    # Check that a channel created while another transport cached one for
+    # the same key is closed in favour of the cached one.
+    cached = mock.Mock()
+    created = mock.Mock()
+
+    def create():
+        transports_grpc._CHANNEL_CACHE["key"] = cached
+        transports_grpc._CHANNEL_REFS[cached] = 1
+        return created
+
+    channel = transports_grpc._shared_channel("key", create)
+    assert channel._channel == cached
+    assert transports_grpc._CHANNEL_REFS[cached] == 2
+    created.close.assert_called_once_with()
+
+
+@mock.patch("google.api_core.grpc_helpers.create_channel", autospec=True)
+def test_access_approval_grpc_transport_channel_cache_closed(grpc_create_channel):
+    # Check that closing a transport's channel directly evicts it, so that
+    # a later transport does not get the closed channel.
+    channels = [mock.Mock(), mock.Mock()]
+    grpc_create_channel.side_effect = channels
+    cred = credentials.AnonymousCredentials()
+
+    transport = transports.AccessApprovalGrpcTransport(credentials=cred)
+    transport.grpc_channel.close()
+    channels[0].close.assert_called_once_with()
+
+    transport = transports.AccessApprovalGrpcTransport(credentials=cred)
+    assert grpc_create_channel.call_count == 2
+    assert transport.grpc_channel._channel == channels[1]
+
+
+def test_access_approval_grpc_asyncio_transport_stubs():
+    # Check that each transport binds and wraps stubs on its own channel.
+    channel1 = mock.Mock()
+    channel2 = mock.Mock()
+    transport1 = transports.AccessApprovalGrpcAsyncIOTransport(channel=channel1)
+    transport2 = transports.AccessApprovalGrpcAsyncIOTransport(channel=channel2)
+
+    assert transport1.get_approval_request == channel1.unary_unary.return_value
+    assert transport2.get_approval_request == channel2.unary_unary.return_value
+    assert channel2.unary_unary.return_value in transport2._wrapped_methods
+    assert channel1.unary_unary.return_value not in transport2._wrapped_methods
+
+
 @mock.patch("grpc.ssl_channel_credentials", autospec=True)
 @mock.patch("google.api_core.grpc_helpers.create_channel", autospec=True)
 def test_access_approval_grpc_transport_channel_mtls_with_client_cert_source(
@@ -2063,6 +2377,12 @@ def test_access_approval_grpc_transport_channel_mtls_with_client_cert_source(
         scopes=("https://www.googleapis.com/auth/cloud-platform",),
         ssl_credentials=mock_ssl_cred,
         quota_project_id=None,
+        options=[
+            ("grpc.keepalive_time_ms", 30000),
+            ("grpc.keepalive_timeout_ms", 10000),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+        ],
     )
     assert transport.grpc_channel == mock_grpc_channel
 
@@ -2135,6 +2455,12 @@ def test_access_approval_grpc_transport_channel_mtls_with_adc(
             scopes=("https://www.googleapis.com/auth/cloud-platform",),
             ssl_credentials=mock_ssl_cred,
             quota_project_id=None,
+            options=[
+                ("grpc.keepalive_time_ms", 30000),
+                ("grpc.keepalive_timeout_ms", 10000),
+                ("grpc.keepalive_permit_without_calls", 1),
+                ("grpc.http2.max_pings_without_data", 0),
+            ],
         )
         assert transport.grpc_channel == mock_grpc_channel
 